@@ -8,6 +8,14 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 
 from utils.ui_helpers import get_contextual_message, show_info_tooltip, MESSAGES
 
+# Shared fixtures promoted to module constants so they are built once at
+# collection time rather than per test invocation.
+EMPTY_STATES = ("no_data_generated", "no_data_cleaned", "no_filters_selected", "empty_analytics")
+LOADING_MESSAGES = ("loading_data", "processing_cleaning", "calculating_metrics", "rendering_charts")
+SUCCESS_MESSAGES = ("cleaning_success", "data_generated", "export_ready")
+GUIDANCE_WORDS = frozenset({"click", "select", "navigate", "run", "create", "generate", "clean"})
+POSITIVE_INDICATORS = frozenset({"success", "ready", "completed", "generated"})
+
 
 class TestUIHelpers:
     def test_messages_dict_structure(self):
@@ -51,9 +59,7 @@ class TestUIHelpers:
         assert "ⓘ" in result
     def test_empty_state_message_icons(self):
 
-        empty_states = ["no_data_generated", "no_data_cleaned", "no_filters_selected", "empty_analytics"]
-
-        for state in empty_states:
+        for state in EMPTY_STATES:
             assert state in MESSAGES
             assert "icon" in MESSAGES[state]
             # Icons should be emoji (1-4 characters typically)
@@ -87,24 +93,19 @@ class TestUIHelpers:
         assert "{step_count}" in MESSAGES["processing_cleaning"]
     def test_empty_state_titles_descriptive(self):
 
-        empty_states = ["no_data_generated", "no_data_cleaned", "no_filters_selected", "empty_analytics"]
-
-        for state in empty_states:
+        for state in EMPTY_STATES:
             title = MESSAGES[state]["title"]
             # Titles should be reasonably long and descriptive
             assert len(title) >= 10
             assert len(title) <= 100
     def test_empty_state_messages_helpful(self):
 
-        empty_states = ["no_data_generated", "no_data_cleaned", "no_filters_selected", "empty_analytics"]
-
-        for state in empty_states:
+        for state in EMPTY_STATES:
             message = MESSAGES[state]["message"]
             # Messages should be helpful and not too short
             assert len(message) >= 20
             # Should contain some action word or guidance
-            guidance_words = ["click", "select", "navigate", "run", "create", "generate", "clean"]
-            assert any(word in message.lower() for word in guidance_words)
+            assert any(word in message.lower() for word in GUIDANCE_WORDS)
 
 
 class TestMessageConsistency:
@@ -112,21 +113,15 @@ class TestMessageConsistency:
 
     def test_all_loading_messages_have_ellipsis(self):
 
-        loading_messages = ["loading_data", "processing_cleaning", "calculating_metrics", "rendering_charts"]
-
-        for msg_key in loading_messages:
+        for msg_key in LOADING_MESSAGES:
             message = MESSAGES[msg_key]
             # Loading messages should end with ... or similar
             assert message.endswith("...") or message.endswith("…")
     def test_success_messages_positive(self):
 
-        success_messages = ["cleaning_success", "data_generated", "export_ready"]
-
-        positive_indicators = ["success", "ready", "completed", "generated"]
-
-        for msg_key in success_messages:
+        for msg_key in SUCCESS_MESSAGES:
             message = MESSAGES[msg_key].lower()
-            assert any(indicator in message for indicator in positive_indicators)
+            assert any(indicator in message for indicator in POSITIVE_INDICATORS)
     def test_no_duplicate_messages(self):
 
         string_messages = {k: v for k, v in MESSAGES.items() if isinstance(v, str)}
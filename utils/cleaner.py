@@ -1,29 +1,70 @@
 import pandas as pd
 import re
-from typing import Optional, List
+from typing import List, Tuple, Dict, Any
 from datetime import datetime
 
+# Compiled once at import; fix_emails runs it against every row.
+EMAIL_RE = re.compile(r"[^@]+@[^@]+\.[^@]+")
+
+# Arrow-backed strings keep text in contiguous UTF-8 buffers, so the
+# .str kernels skip per-row PyObject boxing; fall back to pandas' own
+# string dtype when pyarrow is not installed.
+try:
+    import pyarrow  # noqa: F401
+
+    STRING_DTYPE = "string[pyarrow]"
+except ImportError:
+    STRING_DTYPE = "string"
+
 
 class DataCleaner:
     def __init__(self, df: pd.DataFrame):
         """Initialize the DataCleaner with a raw dataframe."""
-        self.raw_df = df.copy()
+        # raw_df is only ever read, so keep a reference instead of paying
+        # for a second full copy; clean_df is the mutable working frame.
+        self.raw_df = df
         self.clean_df = df.copy()
-        self.log: List[str] = []
+        self._log_entries: List[Tuple[str, Dict[str, Any]]] = []
         self.start_timestamp = datetime.now()
         self.end_timestamp = None
+        self._emails_normalized = False
+
+    @property
+    def log(self) -> List[str]:
+        """Rendered log messages; formatting is deferred until read."""
+        return [template.format(**kwargs) for template, kwargs in self._log_entries]
+
+    def _log(self, template: str, **kwargs) -> None:
+        """Record a log entry without paying string formatting up front."""
+        self._log_entries.append((template, kwargs))
 
     def clean_all(self, steps=None) -> pd.DataFrame:
         """Runs the full data cleaning pipeline or selected steps."""
         if steps is None:
             steps = ["standardize_names", "fix_emails", "remove_duplicates", "clean_dates", "handle_missing_values"]
 
-        if "standardize_names" in steps:
-            self.standardize_names()
-        if "fix_emails" in steps:
-            self.fix_emails()
-        if "remove_duplicates" in steps:
-            self.remove_duplicates()
+        text_steps = {"standardize_names", "fix_emails", "remove_duplicates"}
+
+        # Only adopt the string dtype when a text step will actually touch
+        # these columns; other step selections leave their dtypes alone.
+        if text_steps & set(steps):
+            for col in ("Name", "Email"):
+                if col in self.clean_df.columns:
+                    self.clean_df[col] = self.clean_df[col].astype(STRING_DTYPE)
+
+        if text_steps.issubset(steps):
+            self._clean_text_columns()
+        else:
+            if "standardize_names" in steps:
+                self.standardize_names()
+            if "fix_emails" in steps:
+                self.fix_emails()
+            if "remove_duplicates" in steps:
+                self.remove_duplicates()
+        # Deliberately sequential: both steps assign columns on the shared
+        # frame, and DataFrame.__setitem__ is not thread-safe (a GIL switch
+        # mid-assignment can drop the other thread's update). to_datetime
+        # and fillna hold the GIL anyway, so threads had nothing to win.
         if "clean_dates" in steps:
             self.clean_dates()
         if "handle_missing_values" in steps:
@@ -32,6 +73,36 @@ class DataCleaner:
         self.end_timestamp = datetime.now()
         return self.clean_df
 
+    def _clean_text_columns(self) -> None:
+        """Fused standardize_names + fix_emails + remove_duplicates pass.
+
+        Runs the three text-oriented steps over the Name and Email columns
+        with one write-back instead of materializing the frame once per
+        step. Produces the same results and log entries as calling the
+        individual methods in clean_all order.
+        """
+        df = self.clean_df
+
+        if "Name" in df.columns:
+            df = df.assign(Name=df["Name"].str.title())
+            self._log("Standardized Names to Title Case.")
+
+        if "Email" in df.columns:
+            emails = df["Email"].str.lower().str.strip().str.replace(" at ", "@", regex=False)
+            valid = emails.str.match(EMAIL_RE.pattern, na=False)
+            n_invalid = int((~valid).sum())
+            df = df.assign(Email=emails.where(valid))[valid.to_numpy()]
+            self._emails_normalized = True
+            self._log("Fixed email formatting. Removed {n} invalid emails.", n=n_invalid)
+
+        initial_count = len(df)
+        df = df.drop_duplicates()
+        if "Email" in df.columns:
+            df = df.drop_duplicates(subset=["Email"], keep="first")
+
+        self.clean_df = df
+        self._log("Removed {n} duplicate rows.", n=initial_count - len(df))
+
     def remove_duplicates(self) -> None:
         """Removes duplicates based on Email and Name."""
         initial_count = len(self.clean_df)
@@ -39,64 +110,80 @@ class DataCleaner:
         self.clean_df = self.clean_df.drop_duplicates()
 
         if "Email" in self.clean_df.columns:
-            temp_email = self.clean_df["Email"].astype(str).str.lower()
-            self.clean_df = self.clean_df[~temp_email.duplicated(keep="first")]
+            if self._emails_normalized:
+                # fix_emails already lowercased and stripped the column, so
+                # dedup directly without re-allocating a lowercase copy.
+                self.clean_df = self.clean_df.drop_duplicates(subset=["Email"], keep="first")
+            else:
+                # The lowercase copy is a comparison key only; the column
+                # itself must keep its original casing and NaNs.
+                temp_email = self.clean_df["Email"].astype(str).str.lower()
+                self.clean_df = self.clean_df[~temp_email.duplicated(keep="first")]
 
         final_count = len(self.clean_df)
-        self.log.append(f"Removed {initial_count - final_count} duplicate rows.")
+        self._log("Removed {n} duplicate rows.", n=initial_count - final_count)
 
     def standardize_names(self) -> None:
         """Converts names to Title Case."""
         if "Name" in self.clean_df.columns:
-            self.clean_df["Name"] = self.clean_df["Name"].astype(str).str.title()
-            self.log.append("Standardized Names to Title Case.")
+            # .str.title() skips missing values, so NA stays NA instead of
+            # being stringified into a literal '<Na>'/'Nan' name.
+            self.clean_df["Name"] = self.clean_df["Name"].str.title()
+            self._log("Standardized Names to Title Case.")
 
     def fix_emails(self) -> None:
         """Fixes invalid email formats or drops them."""
         if "Email" not in self.clean_df.columns:
             return
 
-        def clean_email(email: str) -> Optional[str]:
-            if pd.isna(email):
-                return None
-            email = str(email).lower().strip()
-            email = email.replace(" at ", "@")
-            if not re.match(r"[^@]+@[^@]+\.[^@]+", email):
-                return None
-            return email
-
-        self.clean_df["Email"] = self.clean_df["Email"].apply(clean_email)
+        emails = (
+            self.clean_df["Email"]
+            .astype(STRING_DTYPE)
+            .str.lower()
+            .str.strip()
+            .str.replace(" at ", "@", regex=False)
+        )
+        valid = emails.str.match(EMAIL_RE.pattern, na=False)
+        self.clean_df["Email"] = emails.where(valid)
 
         n_before = len(self.clean_df)
         self.clean_df = self.clean_df.dropna(subset=["Email"])
         n_dropped = n_before - len(self.clean_df)
+        self._emails_normalized = True
 
-        self.log.append(f"Fixed email formatting. Removed {n_dropped} invalid emails.")
+        self._log("Fixed email formatting. Removed {n} invalid emails.", n=n_dropped)
 
     def clean_dates(self) -> None:
         """Standardizes Join_Date to datetime objects."""
         if "Join_Date" not in self.clean_df.columns:
             return
 
-        self.clean_df["Join_Date"] = pd.to_datetime(self.clean_df["Join_Date"], errors="coerce")
+        # format="mixed" parses heterogeneous date styles without the slow
+        # per-row fallback, and cache=True memoizes repeated date strings
+        # (common after duplicate injection).
+        self.clean_df["Join_Date"] = pd.to_datetime(
+            self.clean_df["Join_Date"], errors="coerce", format="mixed", cache=True
+        )
 
-        join_dates = self.clean_df["Join_Date"].copy()
-        n_fixed = join_dates.isna().sum()
+        join_dates = self.clean_df["Join_Date"]
+        n_fixed = int(join_dates.isna().sum())
+        mode = join_dates.mode()
 
-        if n_fixed > 0 and not join_dates.mode().empty:
-            mode_date = join_dates.mode()[0]
-            join_dates = join_dates.fillna(mode_date)
-            self.clean_df["Join_Date"] = join_dates
-            self.log.append(f"Standardized Dates. Imputed {n_fixed} missing/bad dates with mode.")
+        if n_fixed > 0 and not mode.empty:
+            self.clean_df["Join_Date"] = join_dates.fillna(mode.iat[0])
+            self._log("Standardized Dates. Imputed {n} missing/bad dates with mode.", n=n_fixed)
         else:
-            self.log.append("Standardized Dates. No missing values found or mode undefined.")
+            self._log("Standardized Dates. No missing values found or mode undefined.")
 
     def handle_missing_values(self) -> None:
         """Fills missing numeric values."""
         if "Event_Attendance" in self.clean_df.columns:
-            n_att = self.clean_df["Event_Attendance"].isna().sum()
-            self.clean_df["Event_Attendance"] = self.clean_df["Event_Attendance"].fillna(0)
-            self.log.append(f"Filled {n_att} missing Attendance records with 0.")
+            col = self.clean_df["Event_Attendance"]
+            n_att = int(col.isna().sum())
+            # Once the NaNs are gone the column no longer needs float64;
+            # downcast to the narrowest lossless integer width.
+            self.clean_df["Event_Attendance"] = pd.to_numeric(col.fillna(0), downcast="unsigned")
+            self._log("Filled {n} missing Attendance records with 0.", n=n_att)
 
 
 if __name__ == "__main__":
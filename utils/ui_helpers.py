@@ -1,19 +1,87 @@
 """UI Helper Module"""
 
 import streamlit as st
+from functools import lru_cache
 from typing import Optional
 
+# Static modal markup hoisted to module level: building these strings per
+# rerun (and re-emitting the <style> block every time) is pure waste since
+# Streamlit re-executes the script on each interaction.
+_WELCOME_CSS = """
+<style>
+.welcome-modal {
+    padding: 2rem;
+    border-radius: 0.5rem;
+    background: #f1f3f5;
+    color: #333;
+    margin-bottom: 2rem;
+    border-left: 5px solid #1f77b4;
+}
+.welcome-title {
+    font-size: 2rem;
+    font-weight: bold;
+    margin-bottom: 1rem;
+}
+.welcome-subtitle {
+    font-size: 1.2rem;
+    margin-bottom: 1rem;
+    opacity: 0.9;
+}
+.feature-list {
+    margin: 1rem 0;
+}
+.feature-item {
+    margin: 0.5rem 0;
+    padding-left: 1.5rem;
+}
+</style>
+"""
+
+_WELCOME_HTML = """
+<div class="welcome-modal">
+    <div class="welcome-title">Welcome to Community Pulse</div>
+    <div class="welcome-subtitle">
+        Transform messy member data into actionable insights in minutes.
+    </div>
+</div>
+"""
+
+# Each modal column's header and bullets joined into one markdown string:
+# one runtime message per column instead of two.
+_WELCOME_COLUMNS = (
+    """### What You Can Do
+- **Generate** realistic messy data
+- **Clean** automatically with AI-powered tools
+- **Visualize** insights with interactive charts
+- **Export** cleaned data in multiple formats""",
+    """### Quick Start
+1. Click **"Generate New Data"** in the sidebar
+2. Navigate to **"Data Preparation"** tab
+3. Click **"Run Cleaning Algorithms"**
+4. Explore insights in **"Analytics"**""",
+    """### Pro Tips
+- Hover over **info icons** for help
+- Toggle between **raw** and **cleaned** views
+- Enable **Tutorial Mode** for step-by-step guidance
+- Check **What's New** for latest features""",
+)
+
+
+# Default session keys as one module-level tuple; initialize_session_state
+# runs on every rerun, so the literal should not be rebuilt per call.
+_SESSION_DEFAULTS = (
+    ("show_welcome", True),
+    ("tutorial_mode", False),
+    ("tutorial_step", 0),
+    ("show_whats_new", False),
+)
+
 
 def initialize_session_state():
     """Initialize session state variables for UI features."""
-    if "show_welcome" not in st.session_state:
-        st.session_state["show_welcome"] = True
-    if "tutorial_mode" not in st.session_state:
-        st.session_state["tutorial_mode"] = False
-    if "tutorial_step" not in st.session_state:
-        st.session_state["tutorial_step"] = 0
-    if "show_whats_new" not in st.session_state:
-        st.session_state["show_whats_new"] = False
+    session_state = st.session_state
+    for key, default in _SESSION_DEFAULTS:
+        session_state.setdefault(key, default)
 
 
 def show_welcome_modal():
@@ -22,80 +90,12 @@ def show_welcome_modal():
         return False
 
     with st.container():
-        st.markdown(
-            """
-        <style>
-        .welcome-modal {
-            padding: 2rem;
-            border-radius: 0.5rem;
-            border-radius: 0.5rem;
-            background: #f1f3f5;
-            color: #333;
-            margin-bottom: 2rem;
-            border-left: 5px solid #1f77b4;
-        }
-        .welcome-title {
-            font-size: 2rem;
-            font-weight: bold;
-            margin-bottom: 1rem;
-        }
-        .welcome-subtitle {
-            font-size: 1.2rem;
-            margin-bottom: 1rem;
-            opacity: 0.9;
-        }
-        .feature-list {
-            margin: 1rem 0;
-        }
-        .feature-item {
-            margin: 0.5rem 0;
-            padding-left: 1.5rem;
-        }
-        </style>
-        """,
-            unsafe_allow_html=True,
-        )
-
-        st.markdown(
-            """
-        <div class="welcome-modal">
-            <div class="welcome-title">Welcome to Community Pulse</div>
-            <div class="welcome-subtitle">
-                Transform messy member data into actionable insights in minutes.
-            </div>
-        </div>
-        """,
-            unsafe_allow_html=True,
-        )
-
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            st.markdown("### What You Can Do")
-            st.markdown("""
-            - **Generate** realistic messy data
-            - **Clean** automatically with AI-powered tools
-            - **Visualize** insights with interactive charts
-            - **Export** cleaned data in multiple formats
-            """)
+        st.markdown(_WELCOME_CSS, unsafe_allow_html=True)
+        st.markdown(_WELCOME_HTML, unsafe_allow_html=True)
 
-        with col2:
-            st.markdown("### Quick Start")
-            st.markdown("""
-            1. Click **"Generate New Data"** in the sidebar
-            2. Navigate to **"Data Preparation"** tab
-            3. Click **"Run Cleaning Algorithms"**
-            4. Explore insights in **"Analytics"**
-            """)
-
-        with col3:
-            st.markdown("### Pro Tips")
-            st.markdown("""
-            - Hover over **info icons** for help
-            - Toggle between **raw** and **cleaned** views
-            - Enable **Tutorial Mode** for step-by-step guidance
-            - Check **What's New** for latest features
-            """)
+        for column, content in zip(st.columns(3), _WELCOME_COLUMNS):
+            with column:
+                st.markdown(content)
 
         st.divider()
 
@@ -121,6 +121,37 @@ def show_welcome_modal():
     return True
 
 
+# Skeleton for show_empty_state; only the three text slots vary between
+# calls, so the surrounding HTML is built once at import.
+_EMPTY_STATE_TEMPLATE = """
+<div style="
+    text-align: center;
+    padding: 4rem 2rem;
+    background: #f8f9fa;
+    border-radius: 0.5rem;
+    margin: 2rem 0;
+">
+    <div style="font-size: 2rem; margin-bottom: 1rem; color: #ccc;">%s</div>
+    <div style="font-size: 1.5rem; font-weight: bold; color: #333; margin-bottom: 0.5rem;">
+        %s
+    </div>
+    <div style="font-size: 1rem; color: #666; margin-bottom: 1.5rem;">
+        %s
+    </div>
+</div>
+"""
+
+
+@lru_cache(maxsize=32)
+def _build_empty_state_html(icon: str, title: str, message: str) -> str:
+    """Render the empty-state block, memoized per text triple.
+
+    Empty states repeat verbatim on every no-data rerun, so repeats hand
+    st.markdown the same string object instead of rebuilding it.
+    """
+    return _EMPTY_STATE_TEMPLATE % (icon, title, message)
+
+
 def show_empty_state(
     icon: str = "",
     title: str = "No Data Available",
@@ -129,26 +160,7 @@ def show_empty_state(
     action_callback: Optional[callable] = None,
 ):
     """Display an empty state message with optional action button."""
-    st.markdown(
-        f"""
-    <div style="
-        text-align: center;
-        padding: 4rem 2rem;
-        background: #f8f9fa;
-        border-radius: 0.5rem;
-        margin: 2rem 0;
-    ">
-        <div style="font-size: 2rem; margin-bottom: 1rem; color: #ccc;">{icon}</div>
-        <div style="font-size: 1.5rem; font-weight: bold; color: #333; margin-bottom: 0.5rem;">
-            {title}
-        </div>
-        <div style="font-size: 1rem; color: #666; margin-bottom: 1.5rem;">
-            {message}
-        </div>
-    </div>
-    """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(_build_empty_state_html(icon, title, message), unsafe_allow_html=True)
 
     if action_label and action_callback:
         col1, col2, col3 = st.columns([1, 1, 1])
@@ -341,9 +353,25 @@ MESSAGES = {
 }
 
 
+# String-valued templates split out once at import so the hot path does a
+# plain dict lookup instead of re-checking isinstance per call.
+_TEMPLATE_MESSAGES = {key: value for key, value in MESSAGES.items() if isinstance(value, str)}
+
+
+@lru_cache(maxsize=64)
+def _render_message(key: str, items: tuple) -> str:
+    """Format a message template, memoized per (key, arguments) pair.
+
+    The same few messages fire on every Streamlit rerun with the same
+    arguments, so repeat renders become a cache hit instead of re-parsing
+    the format string.
+    """
+    template = _TEMPLATE_MESSAGES.get(key)
+    if template is None:
+        return ""
+    return template.format(**dict(items))
+
+
 def get_contextual_message(key: str, **kwargs) -> str:
     """Get a context-aware message template."""
-    template = MESSAGES.get(key, "")
-    if isinstance(template, str):
-        return template.format(**kwargs)
-    return ""
+    return _render_message(key, tuple(sorted(kwargs.items())))
@@ -1,58 +1,133 @@
-import plotly.express as px
-import plotly.graph_objects as go
+from __future__ import annotations
+
 import pandas as pd
 import numpy as np
-from typing import Dict, Any
+import streamlit as st
+from typing import Dict, Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# Plotly costs hundreds of ms to import; defer it until a chart is
+# actually built so sessions that never open the analytics tab (and the
+# app's cold start) skip the cost entirely.
+_plotly = None
+
+
+def _px_go():
+    """Import plotly on first use and return the (px, go) module pair."""
+    global _plotly
+    if _plotly is None:
+        import plotly.express as px
+        import plotly.graph_objects as go
+
+        _plotly = (px, go)
+    return _plotly
 
 # Constants for chart configuration
 MIN_POINTS_FOR_TREND = 3
 DEFAULT_HISTOGRAM_BINS = 20
 
+# Modebar config shared by every chart; passing it at Figure construction
+# saves a layout dict-merge per plot compared to a later update_layout.
+_BASE_LAYOUT = dict(
+    modebar_add=["toImage"],
+    modebar_remove=[],
+)
+
 
 def _add_export_button(fig: go.Figure) -> go.Figure:
-    """Add download button configuration to figure."""
-    fig.update_layout(
-        modebar_add=["toImage"],
-        modebar_remove=[],
-    )
+    """Add download button configuration to figure.
+
+    The plot_* functions bake _BASE_LAYOUT in at construction; this stays
+    for callers that assemble their own figures.
+    """
+    fig.update_layout(**_BASE_LAYOUT)
     return fig
 
 
 def _calculate_stats(data: pd.Series) -> Dict[str, float]:
-    """Calculate statistical measures for a data series."""
-    return {
-        "mean": float(data.mean()),
-        "median": float(data.median()),
-        "std": float(data.std()),
-        "min": float(data.min()),
-        "max": float(data.max()),
-    }
-
-
+    """Calculate statistical measures for a data series.
+
+    Results are memoized on the Series itself (via .attrs) so charts that
+    share a column compute the aggregates once per object instead of once
+    per figure.
+    """
+    cached = data.attrs.get("_stats_cache")
+    if cached is not None:
+        return cached
+
+    # One conversion to a contiguous float array, then plain ndarray
+    # reductions: each Series aggregate re-ran pandas' nan-masking
+    # dispatch, and np.median partitions in O(N) instead of sorting.
+    values = data.to_numpy(dtype=np.float64)
+    values = values[~np.isnan(values)]
+
+    if values.size == 0:
+        nan = float("nan")
+        stats = {"mean": nan, "median": nan, "std": nan, "min": nan, "max": nan}
+    else:
+        stats = {
+            "mean": float(values.mean()),
+            "median": float(np.median(values)),
+            "std": float(values.std(ddof=1)) if values.size > 1 else float("nan"),
+            "min": float(values.min()),
+            "max": float(values.max()),
+        }
+    data.attrs["_stats_cache"] = stats
+    return stats
+
+
+@st.cache_data(show_spinner=False)
+def _monthly_join_trend(df: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """Aggregate join dates into a per-month membership trend frame.
+
+    Cached on the input frame so widget interactions that rerun the script
+    without changing the data skip the datetime parse and groupby entirely.
+    """
+    # Only Join_Date feeds the chart, so work on that one Series instead
+    # of copying the whole frame just to coerce a column.
+    dates = pd.to_datetime(df["Join_Date"], errors="coerce").dropna()
+
+    if dates.empty:
+        return None
+
+    trend = dates.dt.to_period("M").value_counts().sort_index().rename_axis("Join_Date").reset_index(name="New Members")
+    # Vectorized strftime over the period column; astype(str) would fall
+    # back to per-element str() dispatch on an object array.
+    trend["Join_Date"] = trend["Join_Date"].dt.strftime("%Y-%m")
+    return trend
+
+
+# The figures themselves are cached by reference (st.cache_resource, no
+# pickling): rebuilding the trace/annotation object graph per rerun is
+# pure Python overhead, and Streamlit serializes the figure to the
+# frontend without mutating it.
+@st.cache_resource(max_entries=16, show_spinner=False)
 def plot_attendance_trend(df: pd.DataFrame, data_state: str = "cleaned") -> go.Figure:
     """Line chart of attendance over time with trend line."""
+    px, go = _px_go()
     if "Join_Date" not in df.columns:
         return go.Figure()
 
-    temp_df = df.copy()
-    temp_df["Join_Date"] = pd.to_datetime(temp_df["Join_Date"], errors="coerce")
-
-    temp_df = temp_df.dropna(subset=["Join_Date"])
-
-    if len(temp_df) == 0:
+    trend = _monthly_join_trend(df)
+    if trend is None:
         return go.Figure()
 
-    trend = temp_df.groupby(temp_df["Join_Date"].dt.to_period("M")).size().reset_index(name="New Members")
-    trend["Join_Date"] = trend["Join_Date"].astype(str)
-
     stats = _calculate_stats(trend["New Members"])
 
-    fig = go.Figure()
+    # Hand Plotly bare arrays: serialization skips the pandas Series
+    # wrappers, and the cumulative sum reuses the y array directly.
+    months = trend["Join_Date"].to_numpy()
+    new_members = trend["New Members"].to_numpy()
+    cumulative = np.cumsum(new_members)
+
+    fig = go.Figure(layout=_BASE_LAYOUT)
 
     fig.add_trace(
         go.Scatter(
-            x=trend["Join_Date"],
-            y=trend["New Members"],
+            x=months,
+            y=new_members,
             mode="lines+markers",
             name="New Members",
             line=dict(color="#1f77b4", width=3),
@@ -63,19 +138,23 @@ def plot_attendance_trend(df: pd.DataFrame, data_state: str = "cleaned") -> go.F
                 "<b>Cumulative:</b> %{customdata}<br>"
                 "<extra></extra>"
             ),
-            customdata=trend["New Members"].cumsum(),
+            customdata=cumulative,
         )
     )
 
     if len(trend) > MIN_POINTS_FOR_TREND - 1:
-        x_numeric = np.arange(len(trend))
-        z = np.polyfit(x_numeric, trend["New Members"], 1)
-        p = np.poly1d(z)
-        trend_line = p(x_numeric)
+        # Degree-1 least squares has a closed form; np.polyfit would route
+        # the same fit through a general SVD solve.
+        x_numeric = np.arange(len(trend), dtype=np.float64)
+        y = new_members.astype(np.float64)
+        x_centered = x_numeric - x_numeric.mean()
+        slope = (x_centered * (y - y.mean())).sum() / (x_centered**2).sum()
+        intercept = y.mean() - slope * x_numeric.mean()
+        trend_line = intercept + slope * x_numeric
 
         fig.add_trace(
             go.Scatter(
-                x=trend["Join_Date"],
+                x=months,
                 y=trend_line,
                 mode="lines",
                 name="Trend Line",
@@ -107,7 +186,7 @@ def plot_attendance_trend(df: pd.DataFrame, data_state: str = "cleaned") -> go.F
         legend=dict(yanchor="top", y=0.99, xanchor="left", x=0.01),
         annotations=[
             dict(
-                text=f'Mean: {stats["mean"]:.1f} | Median: {stats["median"]:.1f} | Total: {trend["New Members"].sum()}',
+                text=f'Mean: {stats["mean"]:.1f} | Median: {stats["median"]:.1f} | Total: {cumulative[-1]}',
                 xref="paper",
                 yref="paper",
                 x=0.5,
@@ -118,26 +197,29 @@ def plot_attendance_trend(df: pd.DataFrame, data_state: str = "cleaned") -> go.F
         ],
     )
 
-    fig = _add_export_button(fig)
-
     return fig
 
 
+@st.cache_resource(max_entries=16, show_spinner=False)
 def plot_role_distribution(df: pd.DataFrame, data_state: str = "cleaned") -> go.Figure:
     """Pie chart of member roles with counts and percentages."""
+    px, go = _px_go()
     if "Role" not in df.columns:
         return go.Figure()
 
-    counts = df["Role"].value_counts().reset_index()
-    counts.columns = ["Role", "Count"]
-    total = counts["Count"].sum()
-    counts["Percentage"] = (counts["Count"] / total * 100).round(1)
+    # One counting pass, handed to Plotly as plain arrays: the old
+    # reset_index frame plus a Percentage column allocated three
+    # intermediates for values the Pie trace derives itself.
+    counts = df["Role"].value_counts()
+    labels = counts.index.to_numpy()
+    values = counts.to_numpy()
+    total = int(values.sum())
 
     fig = go.Figure(
         data=[
             go.Pie(
-                labels=counts["Role"],
-                values=counts["Count"],
+                labels=labels,
+                values=values,
                 textposition="auto",
                 textinfo="label+percent",
                 hovertemplate=(
@@ -145,7 +227,8 @@ def plot_role_distribution(df: pd.DataFrame, data_state: str = "cleaned") -> go.
                 ),
                 marker=dict(colors=px.colors.qualitative.Set2, line=dict(color="white", width=2)),
             )
-        ]
+        ],
+        layout=_BASE_LAYOUT,
     )
 
     fig.update_layout(
@@ -169,24 +252,30 @@ def plot_role_distribution(df: pd.DataFrame, data_state: str = "cleaned") -> go.
         ],
     )
 
-    fig = _add_export_button(fig)
-
     return fig
 
 
+@st.cache_resource(max_entries=16, show_spinner=False)
 def plot_attendance_histogram(df: pd.DataFrame, data_state: str = "cleaned") -> go.Figure:
     """Histogram of event attendance with statistical annotations."""
+    px, go = _px_go()
     if "Event_Attendance" not in df.columns:
         return go.Figure()
 
     stats = _calculate_stats(df["Event_Attendance"])
 
-    fig = go.Figure()
+    # Bin on the server with NumPy and pin the edges via xbins, so the
+    # frontend renders deterministic bins instead of re-deriving them;
+    # the bare float array also serializes without the Series wrapper.
+    values = df["Event_Attendance"].dropna().to_numpy(dtype=np.float64)
+    edges = np.histogram_bin_edges(values, bins=DEFAULT_HISTOGRAM_BINS)
+
+    fig = go.Figure(layout=_BASE_LAYOUT)
 
     fig.add_trace(
         go.Histogram(
-            x=df["Event_Attendance"],
-            nbinsx=DEFAULT_HISTOGRAM_BINS,
+            x=values,
+            xbins=dict(start=edges[0], end=edges[-1], size=edges[1] - edges[0]),
             name="Member Count",
             marker=dict(color="#1f77b4", line=dict(color="white", width=1)),
             hovertemplate=("<b>Events Attended:</b> %{x}<br>" "<b>Number of Members:</b> %{y}<br>" "<extra></extra>"),
@@ -235,8 +324,6 @@ def plot_attendance_histogram(df: pd.DataFrame, data_state: str = "cleaned") ->
         ],
     )
 
-    fig = _add_export_button(fig)
-
     return fig
 
 
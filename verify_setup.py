@@ -3,6 +3,7 @@
 
 import sys
 import importlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple, List, Dict
 
 # ANSI color codes for terminal output
@@ -57,20 +58,18 @@ def verify_dependencies() -> Dict[str, List[Tuple[str, bool, str]]]:
         ('kaleido', None),
     ]
     
-    results = {
-        'required': [],
-        'optional': []
+    # Deliberately sequential: module imports execute Python bytecode
+    # under the GIL, so threading these buys no wall time, and a plain
+    # loop keeps the report ordering trivial.
+    return {
+        'required': _check_packages(required_packages),
+        'optional': _check_packages(optional_packages),
     }
-    
-    for package_name, min_version in required_packages:
-        success, message = check_package(package_name, min_version)
-        results['required'].append((package_name, success, message))
-    
-    for package_name, min_version in optional_packages:
-        success, message = check_package(package_name, min_version)
-        results['optional'].append((package_name, success, message))
-    
-    return results
+
+
+def _check_packages(packages: List[Tuple[str, str]]) -> List[Tuple[str, bool, str]]:
+    """Run check_package over each (name, min_version) pair."""
+    return [(name, *check_package(name, min_version)) for name, min_version in packages]
 
 
 def check_project_structure() -> List[Tuple[str, bool, str]]:
@@ -89,17 +88,25 @@ def check_project_structure() -> List[Tuple[str, bool, str]]:
         ('tests/', 'directory'),
     ]
     
+    # One scandir per directory resolves every entry's type from the
+    # cached DirEntry instead of a separate stat() call per item.
+    present = {}
+    for root in ('.', 'utils'):
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    path = entry.name if root == '.' else f"{root}/{entry.name}"
+                    present[path] = 'file' if entry.is_file() else 'directory' if entry.is_dir() else None
+        except FileNotFoundError:
+            pass
+
     results = []
-    
+
     for item, item_type in required_items:
-        if item_type == 'file':
-            exists = os.path.isfile(item)
-        else:
-            exists = os.path.isdir(item)
-        
+        exists = present.get(item.rstrip('/')) == item_type
         message = f"{item} ({'✓' if exists else '✗'})"
         results.append((item, exists, message))
-    
+
     return results
 
 
@@ -113,16 +120,19 @@ def test_imports() -> List[Tuple[str, bool, str]]:
         'utils.ui_helpers',
     ]
     
-    results = []
-    
-    for module in modules:
+    def check_module(module: str) -> Tuple[str, bool, str]:
         try:
             importlib.import_module(module)
-            results.append((module, True, f"{module} imports successfully"))
+            return module, True, f"{module} imports successfully"
         except Exception as e:
-            results.append((module, False, f"{module} failed: {str(e)}"))
-    
-    return results
+            return module, False, f"{module} failed: {str(e)}"
+
+    # The project modules only depend on the third-party stack, which
+    # verify_dependencies has already imported by the time main() gets
+    # here, so threading these is safe: each import is a sys.modules hit
+    # plus the module's own (IO-bound) load.
+    with ThreadPoolExecutor(max_workers=len(modules)) as executor:
+        return list(executor.map(check_module, modules))
 
 
 def print_section(title: str):